@@ -3,12 +3,21 @@
 # Import modules and libraries needed within code.
 from dotenv import load_dotenv
 load_dotenv()
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+import json
 import os
 from pathlib import Path
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import sys
+import threading
 import time
 from typing import Dict, List, Optional
+import urllib3
+from urllib3.util.retry import Retry
 
 
 #%%
@@ -42,6 +51,60 @@ except ImportError:
         return raw_dir / filename
 
 
+#%%
+# Optional async HTTP client used by the concurrent bulk crawls. The synchronous getters never touch it, and
+# get_all_general falls back to the serial requests path when it is not installed.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional on-disk response cache. Falls back to an uncached session when requests_cache is not installed.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional streaming JSON parser. Falls back to the buffered response.json() when ijson is not installed. ijson's
+# errors extend Exception rather than ValueError, so the decode-error classes are collected here for _make_request.
+try:
+    import ijson
+    _JSON_DECODE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_DECODE_ERRORS = (ValueError,)
+
+# Optional fast JSON decoder for the buffered parse path when ijson streaming is unavailable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Parquet output. Only needed when a sink path is passed to the bulk crawl methods.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Only advertise Brotli when a decoder is importable (urllib3 and aiohttp probe these same two packages). Advertising
+# 'br' without one makes any Brotli-encoded response undecodable and the request hard-fail.
+try:
+    import brotlicffi as _brotli
+except ImportError:
+    try:
+        import brotli as _brotli
+    except ImportError:
+        _brotli = None
+_ACCEPT_ENCODING = 'gzip, deflate, br' if _brotli is not None else 'gzip, deflate'
+
+
+#%%
+# Public API of this module.
+__all__ = ['FACClient', 'APIError']
+
+
 #%%
 # API error exception class.
 class APIError(Exception):
@@ -49,22 +112,116 @@ class APIError(Exception):
     pass
 
 
+#%%
+# Incremental Parquet writer used by the bulk crawl methods.
+class _ParquetSink:
+    """Appends list-of-dict pages to a Parquet file, inferring the schema from the first non-empty page."""
+    def __init__(self, path) -> None:
+        if pa is None:
+            raise APIError("pyarrow is required for Parquet output. Install pyarrow or drop the sink argument.")
+        self.path = Path(path)
+        self._writer = None
+        self._schema = None
+
+    def write_page(self, page: List[Dict]) -> None:
+        """
+        Purpose:
+            Append one page of records to the Parquet file. The first non-empty page fixes the schema.
+        Args:
+            page: List of record dictionaries as returned by the API.
+        """
+        if not page:
+            return
+        if self._schema is None:
+            table = pa.Table.from_pylist(page)
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression='zstd')
+        else:
+            table = pa.Table.from_pylist(page, schema=self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Close the underlying writer, finalizing the Parquet footer."""
+        if self._writer is not None:
+            self._writer.close()
+
+
 #%%
 # FAC API Client.
 class FACClient:
     """Basic client for interacting with the Federal Audit Clearinghouse API."""
+
+    _API_KEY = os.getenv('API_KEY_FAC')  # Read once at class definition; load_dotenv() has already run at module import.
+
+    # Allowed columns for the general endpoint, shared by get_general and the bulk crawls so a typo'd column fails
+    # client-side with the allowed names instead of surfacing as per-year HTTP 400s mid-crawl.
+    _GENERAL_COLUMNS = [
+        'report_id', 'auditee_uei', 'audit_year', 'auditee_certify_name', 'auditee_certify_title', 'auditee_contact_name', 'auditee_email'
+        , 'auditee_name', 'auditee_phone', 'auditee_contact_title', 'auditee_address_line_1', 'auditee_city', 'auditee_state', 'auditee_ein'
+        , 'auditee_zip', 'auditor_certify_name', 'auditor_certify_title', 'auditor_phone', 'auditor_state', 'auditor_city', 'auditor_contact_title'
+        , 'auditor_address_line_1', 'auditor_zip', 'auditor_country', 'auditor_contact_name', 'auditor_email', 'auditor_firm_name'
+        , 'auditor_foreign_address', 'auditor_ein', 'cognizant_agency', 'oversight_agency', 'date_created', 'ready_for_certification_date'
+        , 'auditor_certified_date', 'auditee_certified_date', 'submitted_date', 'fac_accepted_date', 'fy_end_date', 'fy_start_date', 'audit_type'
+        , 'gaap_results', 'sp_framework_basis', 'is_sp_framework_required', 'sp_framework_opinions', 'is_going_concern_included'
+        , 'is_internal_control_deficiency_disclosed', 'is_internal_control_material_weakness_disclosed', 'is_material_noncompliance_disclosed'
+        , 'dollar_threshold', 'is_low_risk_auditee', 'agencies_with_prior_findings', 'entity_type', 'number_months', 'audit_period_covered'
+        , 'total_amount_expended', 'type_audit_code', 'is_public', 'data_source', 'is_aicpa_audit_guide_included', 'is_additional_ueis'
+        , 'is_multiple_eins', 'is_secondary_auditors'
+    ]
+
     def __init__(self) -> None:
         """
         Initialize the FAC API client and key class-level characters.
         """
-        # Set up headers.
-        self.api_key = os.getenv('API_KEY_FAC')
-        self.session = requests.Session()
+        # Set up headers. Fall back to the environment for keys exported after import (e.g., by a test harness).
+        self.api_key = type(self)._API_KEY or os.getenv('API_KEY_FAC')
+        if requests_cache is not None:
+            # Cache idempotent GET responses on disk: past audit years are effectively immutable, so rerunning a crawl
+            # answers from SQLite instead of re-downloading the corpus. CachedSession is API-compatible with Session.
+            self.session = requests_cache.CachedSession(
+                cache_name=str(get_cache_path('fac_responses', 'db'))
+                , backend='sqlite'
+                , expire_after=timedelta(days=30)
+                , allowable_methods=('GET',)
+            )
+        else:
+            print("Warning: requests_cache not installed. API responses will not be cached on disk.")
+            self.session = requests.Session()
         if self.api_key:
             self.session.headers.update({'X-API-Key': self.api_key})  # Header gets sent with every request automatically.
         else:
             raise APIError("API key is required. Set API_KEY_FAC environment variable.")
-        
+        # Ask for compressed JSON explicitly: large /general pages compress 5-10x and urllib3 decompresses in C. requests
+        # sends Accept-Encoding by default but proxies sometimes strip it, so pin it here.
+        self.session.headers.update({'Accept-Encoding': _ACCEPT_ENCODING, 'Accept': 'application/json'})
+
+        # Mount an adapter with a larger connection pool and transport-level retries. The default pool of 10 connections throttles the
+        # concurrent bulk crawls, and retrying transient 5xx responses in urllib3 keeps them from bubbling up as APIErrors.
+        retry = Retry(
+            total=5
+            , backoff_factor=0.5
+            , status_forcelist=(500, 502, 503, 504)
+            , allowed_methods=frozenset(['GET'])
+            , respect_retry_after_header=True
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry))
+
+        # Adaptive token bucket pacing (additive increase / multiplicative decrease): the request rate creeps up while calls
+        # succeed and halves on 429, so concurrent workers settle near the server's actual quota instead of retrying in lockstep.
+        self.bucket_initial_rate = 4.0  # Starting requests per second.
+        self.bucket_min_rate = 0.5  # Floor after repeated 429s.
+        self.bucket_max_rate = 32.0  # Ceiling on requests per second.
+        self.bucket_increase = 0.1  # Additive rate increase per successful request.
+        self.bucket_decrease = 2.0  # Multiplicative decrease divisor on 429.
+        self._bucket = {'tokens': self.bucket_initial_rate, 'rate': self.bucket_initial_rate, 'last': time.monotonic()}
+        self._bucket_lock = threading.Lock()  # Guards the bucket for threaded callers; held only briefly so async callers are fine too.
+
+        # 429 retry policy when the Retry-After header is missing or unusable: exponential backoff with randomized jitter
+        # so concurrent workers do not wake up and retry in a synchronized storm.
+        self.retry_max_attempts = 8  # Give up and raise APIError after this many 429s on one request.
+        self.retry_base_delay = 1.0  # Seconds; doubled each attempt.
+        self.retry_max_delay = 60.0  # Cap on the computed backoff delay.
+
         # Set up API url.
         self.base_url = 'https://api.fac.gov'
         self.endpoints = {
@@ -79,9 +236,21 @@ class FACClient:
             , 'passthrough': '/passthrough'
             , 'secondary_auditors': '/secondary_auditors'
         }
+        # Precompute the full URL per endpoint once; _make_request runs tens of thousands of times per crawl and only
+        # needs a single dict lookup instead of re-validating and re-formatting the URL on every call.
+        self._endpoint_urls = {name: f"{self.base_url}{path}" for name, path in self.endpoints.items()}
+
+        # Persistent record of closed audit years that returned zero rows. Closed years cannot gain filings, so skipping
+        # them on later runs saves their round-trips outright.
+        self._empty_years_path = get_cache_path('fac_empty_years')
+        try:
+            self._empty_years = set(json.loads(self._empty_years_path.read_text()))
+        except (OSError, ValueError):
+            self._empty_years = set()
 
         # Features of the FAC API.
         self.max_single_request_size = 20_000
+        self.max_filter_chars = 7_500  # Character budget for in.(...) filters; keeps URLs under the common ~8 KB server cap.
         self.min_audit_year = 2016
         self.max_audit_year = int(time.strftime('%Y'))
         self.all_auditee_states = [
@@ -116,7 +285,96 @@ class FACClient:
         
         output_string = input_string.strip().lower()  # Normalize the string variable.
         return output_string
-    
+
+    def _validate_general_columns(self, columns: List[str]) -> None:
+        """
+        Purpose:
+            Validate a column selection against the general endpoint's allowed columns before any request is built, so
+            a typo fails immediately client-side instead of as a server-side 400.
+        Args:
+            columns: List of column names to validate.
+        Raises:
+            ValueError: If any column is not an allowed general-endpoint column.
+            TypeError: If columns is not a list.
+        """
+        if not isinstance(columns, list):
+            raise TypeError(f"columns must be a list, got {type(columns).__name__}.")
+        for col in columns:  # Validate that all columns input are allowed columns.
+            if col.strip().lower() not in self._GENERAL_COLUMNS:
+                raise ValueError(f"Invalid column name: {col}. Allowed columns: {', '.join(self._GENERAL_COLUMNS)}.")
+
+    def _refill_tokens(self) -> float:
+        """
+        Purpose:
+            Refill the token bucket based on elapsed time and take one token if available. Caller must hold _bucket_lock.
+        Returns:
+            0.0 if a token was taken, otherwise the number of seconds until the next token becomes available.
+        """
+        now = time.monotonic()
+        bucket = self._bucket
+        bucket['tokens'] = min(bucket['rate'], bucket['tokens'] + (now - bucket['last']) * bucket['rate'])
+        bucket['last'] = now
+        if bucket['tokens'] >= 1:
+            bucket['tokens'] -= 1
+            return 0.0
+        return (1 - bucket['tokens']) / bucket['rate']
+
+    def _acquire(self) -> None:
+        """
+        Purpose:
+            Block until the token bucket grants one request slot.
+        """
+        while True:
+            with self._bucket_lock:
+                wait = self._refill_tokens()
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+    async def _aacquire(self) -> None:
+        """
+        Purpose:
+            Async variant of _acquire; waits on the event loop instead of blocking the thread.
+        """
+        while True:
+            with self._bucket_lock:
+                wait = self._refill_tokens()
+            if wait == 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def _on_success(self) -> None:
+        """
+        Purpose:
+            Additively raise the request rate after a successful call, up to bucket_max_rate.
+        """
+        with self._bucket_lock:
+            self._bucket['rate'] = min(self.bucket_max_rate, self._bucket['rate'] + self.bucket_increase)
+
+    def _on_429(self) -> None:
+        """
+        Purpose:
+            Multiplicatively drop the request rate after a 429, down to bucket_min_rate.
+        """
+        with self._bucket_lock:
+            self._bucket['rate'] = max(self.bucket_min_rate, self._bucket['rate'] / self.bucket_decrease)
+
+    def _record_empty_year(self, year: int) -> None:
+        """
+        Purpose:
+            Persist a closed audit year that returned zero rows so subsequent runs skip its round-trip entirely.
+        Args:
+            year: Audit year that returned no records. The current and prior year can still receive filings, so they are
+                never recorded.
+        """
+        if year >= self.max_audit_year - 1:
+            return
+        self._empty_years.add(year)
+        try:
+            self._empty_years_path.write_text(json.dumps(sorted(self._empty_years)))
+        except OSError as e:
+            print(f"Warning: could not persist empty-year cache: {e}")
+
     def _make_request(self, endpoint_name: str, params: Dict = None, handle_429: bool = False) -> List[Dict]:
         """
         Purpose:
@@ -132,20 +390,29 @@ class FACClient:
             ValueError: If endpoint_name is invalid
             TypeError: If endpoint_name is not a string
         """
-        # Exception and type handling for endpoint_name variable.
-        endpoint_name = self._validate_string(endpoint_name)
-        if endpoint_name not in self.endpoints:
+        # Internal callers pass literal endpoint names, so a precomputed lookup covers validation too.
+        url = self._endpoint_urls.get(endpoint_name)
+        if url is None:
             available = ', '.join(self.endpoints.keys())
             raise ValueError(f"Unknown endpoint: '{endpoint_name}'. Available: {available}")
-        
-        endpoint = self.endpoints.get(f"{endpoint_name}")  # Identify the endpoint to add to the url.
-        url = f"{self.base_url}{endpoint}"  # Add endpoint to the base url.
-        
+
+        attempt = 0  # Number of 429 retries performed for this request.
         while True:
             try:
-                response = self.session.get(url, params=params or {})
+                self._acquire()  # Token bucket pacing; blocks until a request slot is available.
+                response = self.session.get(url, params=params or {}, stream=True)
                 response.raise_for_status()  # Raises exception for bad status codes.
-                result = response.json()
+                self._on_success()
+                if ijson is not None:
+                    # Parse records straight off the wire instead of buffering the full body and decoding it in one
+                    # allocation; a 20,000-row page no longer peaks at twice its wire size in memory.
+                    response.raw.decode_content = True  # Let urllib3 decompress the stream before ijson sees it.
+                    result = list(ijson.items(response.raw, 'item'))
+                elif orjson is not None:
+                    # 2-5x faster than the stdlib decoder on these dict-of-str payloads; same list/dict structure out.
+                    result = orjson.loads(response.content)
+                else:
+                    result = response.json()
 
                 if isinstance(result, list):  # FAC API returns data as a list
                     return result
@@ -156,34 +423,136 @@ class FACClient:
                 if response.status_code == 401:
                     raise APIError("Authentication failed. Check your API key.") from e
                 elif response.status_code == 429:
+                    self._on_429()  # Back the shared request rate off before deciding how to retry.
+                    response.close()  # The streamed body was never read; release the pooled connection before waiting.
                     if not handle_429:
                         raise APIError("Rate limit exceeded. Please wait before making more requests.") from e
-                    else:
+                    attempt += 1
+                    if attempt > self.retry_max_attempts:
+                        raise APIError(f"Rate limit exceeded after {self.retry_max_attempts} retries for {endpoint_name}.") from e
+                    retry_after = response.headers.get('Retry-After') or response.headers.get('retry-after')
+                    wait_time = None
+                    if retry_after:
+                        try:
+                            wait_time = float(retry_after)
+                            print(f"Rate limit hit (Server requested {retry_after}s wait. Waiting {wait_time:.1f}s...")
+                        except ValueError:
+                            print(f"Invalid Retry-After header: {retry_after}")
+                    if wait_time is None:  # No usable header; exponential backoff with jitter to avoid synchronized retries.
+                        wait_time = min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt) + random.uniform(0, 1)
+                    time.sleep(wait_time)
+                    continue
+
+                elif response.status_code == 404:
+                    raise APIError(f"Endpoint not found: {endpoint_name}") from e
+                else:
+                    raise APIError(f"HTTP {response.status_code} error for {endpoint_name}: {e}") from e
+            except requests.exceptions.ConnectionError as e:
+                raise APIError(f"Failed to connect to FAC API: {e}") from e
+            except requests.exceptions.Timeout as e:
+                raise APIError(f"Request timeout for {endpoint_name}: {e}") from e
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Request failed for {endpoint_name}: {e}") from e
+            except urllib3.exceptions.HTTPError as e:
+                # Reading response.raw directly bypasses requests' exception translation, so a mid-body connection
+                # reset, truncated stream, or corrupt gzip surfaces as a raw urllib3 error. Wrap it like the buffered
+                # path would so callers only ever have to handle APIError.
+                raise APIError(f"Failed to connect to FAC API mid-response for {endpoint_name}: {e}") from e
+            except _JSON_DECODE_ERRORS as e:  # JSON decode error (orjson and the stdlib raise ValueError; ijson has its own hierarchy).
+                raise APIError(f"Invalid JSON response from {endpoint_name}: {e}") from e
+            # Every path above either returns records, raises APIError, or continues into a retry; the loop can never
+            # fall through and implicitly return None to a caller expecting a list.
+
+    def _paginate(self, endpoint_name: str, params: Dict = None, page_size: int = None):
+        """
+        Purpose:
+            Page through an endpoint server-side with limit/offset (PostgREST pagination) until a short page signals the end.
+            This replaces client-side sharding tricks: one filter, as many pages as the row count actually requires.
+        Args:
+            endpoint_name: Name of the endpoint (e.g., 'general', 'findings')
+            params: Query parameters to include in every page request
+            page_size: Rows per page; defaults to the API's 20,000-row request cap.
+        Yields:
+            Lists of records, one list per page.
+        """
+        if page_size is None:
+            page_size = self.max_single_request_size
+        params = dict(params or {})  # Copy so the caller's dict is not mutated by the paging keys.
+        offset = 0
+        while True:
+            params['limit'] = page_size
+            params['offset'] = offset
+            page = self._make_request(endpoint_name=endpoint_name, params=params, handle_429=True)
+            if page:
+                yield page
+            if len(page) < page_size:  # A short page means the result set is exhausted.
+                return
+            offset += page_size
+
+    async def _amake_request(self, session: "aiohttp.ClientSession", endpoint_name: str, params: Dict = None) -> List[Dict]:
+        """
+        Purpose:
+            Async sibling of _make_request used by the concurrent bulk helpers. Always retries on 429 using the Retry-After header
+            since the bulk crawls are long-running and expected to ride out rate limits.
+        Args:
+            session: Shared aiohttp client session for the crawl.
+            endpoint_name: Name of the endpoint (e.g., 'general', 'findings')
+            params: Query parameters to include in the request
+        Returns:
+            List of records from the API.
+        Raises:
+            APIError: If the API request fails
+            ValueError: If endpoint_name is invalid
+        """
+        url = self._endpoint_urls.get(endpoint_name)
+        if url is None:
+            available = ', '.join(self.endpoints.keys())
+            raise ValueError(f"Unknown endpoint: '{endpoint_name}'. Available: {available}")
+
+        attempt = 0  # Number of 429 retries performed for this request.
+        while True:
+            try:
+                await self._aacquire()  # Token bucket pacing shared with the sync path.
+                async with session.get(url, params=params or {}) as response:
+                    if response.status == 401:
+                        raise APIError("Authentication failed. Check your API key.")
+                    elif response.status == 429:
+                        self._on_429()  # Back the shared request rate off before retrying.
+                        attempt += 1
+                        if attempt > self.retry_max_attempts:
+                            raise APIError(f"Rate limit exceeded after {self.retry_max_attempts} retries for {endpoint_name}.")
                         retry_after = response.headers.get('Retry-After') or response.headers.get('retry-after')
+                        wait_time = None
                         if retry_after:
                             try:
                                 wait_time = float(retry_after)
                                 print(f"Rate limit hit (Server requested {retry_after}s wait. Waiting {wait_time:.1f}s...")
-                                time.sleep(wait_time)
-                                continue
                             except ValueError:
                                 print(f"Invalid Retry-After header: {retry_after}")
-                
-                elif response.status_code == 404:
-                    raise APIError(f"Endpoint not found: {endpoint_name}") from e
+                        if wait_time is None:  # No usable header; exponential backoff with jitter to avoid synchronized retries.
+                            wait_time = min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt) + random.uniform(0, 1)
+                        await asyncio.sleep(wait_time)
+                        continue
+                    elif response.status == 404:
+                        raise APIError(f"Endpoint not found: {endpoint_name}")
+                    elif response.status >= 400:
+                        raise APIError(f"HTTP {response.status} error for {endpoint_name}")
+                    self._on_success()
+                    result = await response.json()
+
+                if isinstance(result, list):  # FAC API returns data as a list
+                    return result
                 else:
-                    raise APIError(f"HTTP {response.status_code} error for {endpoint_name}: {e}") from e
-            except requests.exceptions.ConnectionError as e:
+                    print(f"Warning: Expected list from {endpoint_name}, got {type(result)}")  # Log unexpected response format
+                    return []
+            except aiohttp.ClientConnectionError as e:
                 raise APIError(f"Failed to connect to FAC API: {e}") from e
-            except requests.exceptions.Timeout as e:
+            except asyncio.TimeoutError as e:
                 raise APIError(f"Request timeout for {endpoint_name}: {e}") from e
-            except requests.exceptions.RequestException as e:
+            except aiohttp.ClientError as e:
                 raise APIError(f"Request failed for {endpoint_name}: {e}") from e
             except ValueError as e:  # JSON decode error
                 raise APIError(f"Invalid JSON response from {endpoint_name}: {e}") from e
-            
-            if not handle_429:
-                break
 
     def get_general(self
                     , columns: List[str] | None = None
@@ -214,26 +583,8 @@ class FACClient:
         """
         params = {}  # Initialize an empty dictionary for query parameters.
         if columns is not None:
-            if isinstance(columns, list):
-                for col in columns:  # Validate that all columns input are allowed columns.
-                    allowed_columns = [  # List of allowed columns for the general endpoint.
-                        'report_id', 'auditee_uei', 'audit_year', 'auditee_certify_name', 'auditee_certify_title', 'auditee_contact_name', 'auditee_email'
-                        , 'auditee_name', 'auditee_phone', 'auditee_contact_title', 'auditee_address_line_1', 'auditee_city', 'auditee_state', 'auditee_ein'
-                        , 'auditee_zip', 'auditor_certify_name', 'auditor_certify_title', 'auditor_phone', 'auditor_state', 'auditor_city', 'auditor_contact_title'
-                        , 'auditor_address_line_1', 'auditor_zip', 'auditor_country', 'auditor_contact_name', 'auditor_email', 'auditor_firm_name'
-                        , 'auditor_foreign_address', 'auditor_ein', 'cognizant_agency', 'oversight_agency', 'date_created', 'ready_for_certification_date'
-                        , 'auditor_certified_date', 'auditee_certified_date', 'submitted_date', 'fac_accepted_date', 'fy_end_date', 'fy_start_date', 'audit_type'
-                        , 'gaap_results', 'sp_framework_basis', 'is_sp_framework_required', 'sp_framework_opinions', 'is_going_concern_included'
-                        , 'is_internal_control_deficiency_disclosed', 'is_internal_control_material_weakness_disclosed', 'is_material_noncompliance_disclosed'
-                        , 'dollar_threshold', 'is_low_risk_auditee', 'agencies_with_prior_findings', 'entity_type', 'number_months', 'audit_period_covered'
-                        , 'total_amount_expended', 'type_audit_code', 'is_public', 'data_source', 'is_aicpa_audit_guide_included', 'is_additional_ueis'
-                        , 'is_multiple_eins', 'is_secondary_auditors'
-                    ]
-                    if col.strip().lower() not in allowed_columns:
-                        raise ValueError(f"Invalid column name: {col}. Allowed columns: {', '.join(allowed_columns)}.")
-                params['select'] = ','.join(columns)
-            else:
-                raise TypeError(f"columns must be a list, got {type(columns).__name__}.")
+            self._validate_general_columns(columns)
+            params['select'] = ','.join(columns)
         if report_id is not None:
             params['report_id'] = f"eq.{report_id}"
         if auditee_uei is not None:
@@ -291,17 +642,17 @@ class FACClient:
             else:
                 raise TypeError(f"columns must be a list, got {type(columns).__name__}.")
         if report_id is not None:
-            params = {'report_id': f"eq.{report_id}"}
+            params['report_id'] = f"eq.{report_id}"
         if federal_agency_prefix is not None:
-            params = {'federal_agency_prefix': f"eq.{federal_agency_prefix}"}
+            params['federal_agency_prefix'] = f"eq.{federal_agency_prefix}"
             if federal_award_extension is not None:
-                params = {'federal_award_extension': f"eq.{federal_award_extension}"}
+                params['federal_award_extension'] = f"eq.{federal_award_extension}"
         if additional_award_identification is not None:
-            params = {'additional_award_identification': f"eq.*{additional_award_identification}*"}
+            params['additional_award_identification'] = f"eq.*{additional_award_identification}*"
         if federal_program_name is not None:
-            params = {'federal_program_name': f"ilike.*{federal_program_name}*"}  # "ilike" is case insensitive. "like" is case sensitive.
+            params['federal_program_name'] = f"ilike.*{federal_program_name}*"  # "ilike" is case insensitive. "like" is case sensitive.
         if cluster_name is not None:
-            params = {'cluster_name': f"ilike.*{cluster_name}*"}
+            params['cluster_name'] = f"ilike.*{cluster_name}*"
 
         return self._make_request(endpoint_name='federal_awards', params=params, handle_429=handle_429)
     
@@ -580,86 +931,225 @@ class FACClient:
         
         return self._make_request(endpoint_name='secondary_auditors', params=params, handle_429=handle_429)
 
-    def get_all_general(self, columns: list[str] | None = None, show_progress: bool = False) -> list[Dict]:
+    async def _gather_general(self, columns: list[str] | None, show_progress: bool, concurrency: int, sink: str | Path | None = None):
         """
         Purpose:
-            Collect all results from the \"general\" endpoint from the FAC database.
+            Fetch every audit year concurrently, paging each year server-side with limit/offset. The old code sharded by
+            (year, state) purely to stay under the 20,000-row cap, which cost 59 round-trips per year even for empty states;
+            paging a single year filter needs only as many requests as the year has pages.
         Args:
             columns: List of column names to select from the general endpoint. If None, all columns are returned.
             show_progress: Boolean value to print out results in the terminal for testing reasons.
+            concurrency: Maximum number of in-flight requests.
+            sink: Optional Parquet file path. When given, each year's records are appended to the file as its task
+                finishes, so memory stays flat regardless of corpus size.
         Returns:
-            all_results: A list of all of the dictionary responses that are returned from the API.
+            A list of all of the dictionary responses, or the sink Path when sink is given.
         """
-        all_results = []  # Store all queried results from the FAC database.
-        
-        # The max number of results that can be pulled from the API is 20,000 results. Looping over time and states ensures no call asks for too many records.
-        for year in range(self.min_audit_year, self.max_audit_year + 1):  # Loop from 2016 to the current year.
-            for state in self.all_auditee_states:  # Loop across all states.
-                if show_progress:  # Print out the current year and state being processed.
-                    print(f"Processing {year}-{state}...")
-                try:  # Exception handling for API calls.
-                    results = self.get_general(columns=columns, audit_year=year, auditee_state=state, handle_429=True)  # Get results for the current year and state.
+        semaphore = asyncio.Semaphore(concurrency)  # Bound the number of in-flight requests.
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        page_size = self.max_single_request_size  # The max number of results that can be pulled per request is 20,000.
+
+        headers = {'X-API-Key': self.api_key, 'Accept-Encoding': _ACCEPT_ENCODING, 'Accept': 'application/json'}
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            async def fetch_year(year: int) -> List[Dict]:
+                params = {}
+                if columns is not None:
+                    params['select'] = ','.join(columns)
+                params['audit_year'] = f"eq.{year}"
+                results = []
+                offset = 0
+                try:
+                    while True:  # Page until a short page signals the year is exhausted.
+                        params['limit'] = page_size
+                        params['offset'] = offset
+                        async with semaphore:
+                            if show_progress:  # Print out the current year and page being processed.
+                                print(f"Processing {year} (offset {offset})...")
+                            page = await self._amake_request(session, 'general', params=params)
+                        results.extend(page)
+                        if len(page) < page_size:
+                            break
+                        offset += page_size
+                    if not results:  # The year completed cleanly with zero rows; remember it if it is closed.
+                        self._record_empty_year(year)
+                except APIError as e:  # Exception handling for API calls; keep whatever pages already arrived.
+                    print(f"Error retrieving data for {year}: {e}")
+                return results
+
+            # From 2016 to the current year, skipping closed years already known to be empty.
+            years = [year for year in range(self.min_audit_year, self.max_audit_year + 1) if year not in self._empty_years]
+            tasks = [asyncio.ensure_future(fetch_year(year)) for year in years]
+
+            if sink is None:
+                all_results = []  # Store all queried results from the FAC database.
+                for results in await asyncio.gather(*tasks):
                     all_results.extend(results)  # Add pulled results to the all_results list.
-                except APIError as e:
-                    print(f"Error retrieving data for {year}-{state}: {e}")
-        if show_progress:  # Return the total number of records retrieved.
-            print(f"Total records retrieved: {len(all_results)}")
-        return all_results
+                return all_results
+
+            writer = _ParquetSink(sink)  # Stream each year's records to disk as its task completes.
+            try:
+                for task in asyncio.as_completed(tasks):
+                    writer.write_page(await task)
+            finally:
+                writer.close()
+            return writer.path
+
+    def get_all_general(self, columns: list[str] | None = None, show_progress: bool = False, concurrency: int = 16, sink: str | Path | None = None):
+        """
+        Purpose:
+            Collect all results from the \"general\" endpoint from the FAC database. Shards are fetched concurrently with
+            aiohttp; the method itself stays synchronous so existing callers are unchanged.
+        Args:
+            columns: List of column names to select from the general endpoint. If None, all columns are returned.
+            show_progress: Boolean value to print out results in the terminal for testing reasons.
+            concurrency: Maximum number of concurrent requests against the API.
+            sink: Optional Parquet file path. When given, records are appended to the file incrementally and the path is
+                returned instead of an in-memory list, keeping memory flat for full-corpus crawls.
+        Returns:
+            A list of all of the dictionary responses, or the sink Path when sink is given.
+        """
+        if columns is not None:
+            self._validate_general_columns(columns)  # Fail a typo'd column here, not as a swallowed per-year HTTP 400.
+
+        if aiohttp is None:
+            # Serial fallback over the sync session: same records and same sink semantics, just one page in flight.
+            print("Warning: aiohttp not installed. Fetching years serially; install aiohttp for the concurrent crawl.")
+            if sink is None:
+                output = []
+                for page in self.iter_all_general(columns=columns, show_progress=show_progress):
+                    output.extend(page)
+            else:
+                writer = _ParquetSink(sink)
+                try:
+                    for page in self.iter_all_general(columns=columns, show_progress=show_progress):
+                        writer.write_page(page)
+                finally:
+                    writer.close()
+                output = writer.path
+        else:
+            output = asyncio.run(self._gather_general(columns=columns, show_progress=show_progress, concurrency=concurrency, sink=sink))
+        if show_progress:  # Report what was retrieved.
+            if sink is None:
+                print(f"Total records retrieved: {len(output)}")
+            else:
+                print(f"Records written to {output}")
+        return output
+
+    def iter_all_general(self, columns: list[str] | None = None, show_progress: bool = False):
+        """
+        Purpose:
+            Stream the \"general\" endpoint page-by-page instead of materializing the full corpus. Useful when the caller
+            only aggregates (e.g., folding report_ids into a set) and never needs every record alive at once. Pages arrive
+            serially; use get_all_general for the concurrent in-memory crawl.
+        Args:
+            columns: List of column names to select from the general endpoint. If None, all columns are returned.
+            show_progress: Boolean value to print out results in the terminal for testing reasons.
+        Yields:
+            Lists of records, one list per fetched page.
+        """
+        if columns is not None:
+            self._validate_general_columns(columns)  # Fail a typo'd column here, not as a swallowed per-year HTTP 400.
+
+        for year in range(self.min_audit_year, self.max_audit_year + 1):  # From 2016 to the current year.
+            if year in self._empty_years:  # Closed year already known to have zero rows.
+                continue
+            params = {}
+            if columns is not None:
+                params['select'] = ','.join(columns)
+            params['audit_year'] = f"eq.{year}"
+            if show_progress:  # Print out the current year being processed.
+                print(f"Processing {year}...")
+            year_records = 0
+            for page in self._paginate('general', params=params):
+                year_records += len(page)
+                yield page
+            if year_records == 0:  # The year completed cleanly with zero rows; remember it if it is closed.
+                self._record_empty_year(year)
     
-    def get_all_federal_awards(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
+    def _collect_by_report_ids(self, endpoint_name: str, record_label: str, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8, sink: str | Path | None = None):
         """
         Purpose:
-            Retrieve all federal award records by batching report_ids from general endpoint.
-            This approach works around the federal_awards endpoint's limited filtering options.
+            Shared crawl loop for endpoints that can only be filtered usefully by report_id: enumerate report_ids from the
+            general endpoint, then fetch the target endpoint in report_id batches. All of the get_all_* batch methods
+            delegate here.
         Args:
+            endpoint_name: Name of the endpoint to batch over (e.g., 'federal_awards')
+            record_label: Record label used in progress output (e.g., 'federal award')
             batch_size: Number of report_ids to include in each API call (adjust to stay under 20K limit)
             show_progress: Whether to print progress updates
+            save_progress: Whether to write rolling Parquet checkpoint segments ({endpoint}_ckpt_{n}.parquet) under data/raw
+            max_workers: Number of concurrent batch fetches; the token bucket still paces the aggregate request rate
+            sink: Optional Parquet file path written incrementally instead of returning a list
         Returns:
-            List of all federal award records
+            List of records from the endpoint, or the sink Path when sink is given
         """
+        # Fail or degrade before any requests go out: discovering a missing pyarrow mid-crawl (first _ParquetSink
+        # construction) would abort after the report_id enumeration and throw away every in-flight batch.
+        if sink is not None and pa is None:
+            raise APIError("pyarrow is required for Parquet output. Install pyarrow or drop the sink argument.")
+        if save_progress and sink is None and pa is None:
+            print("Warning: pyarrow not installed. Progress checkpoints are disabled for this run.")
+            save_progress = False
+
         if show_progress:
             print("Step 1: Getting all report_ids from general endpoint...")
-        
+
         # Get all report id values from the general records
         try:
             report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
             if show_progress:
                 print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
+            # Extract unique report_ids. A set comprehension dedupes in one pass without materializing a throwaway list first.
+            report_ids = list({record['report_id'] for record in report_id_records if 'report_id' in record})
         except Exception as e:
             raise APIError(f"Failed to get general records: {e}")
-        
+
         if show_progress:
             print(f"Step 2: Found {len(report_ids)} unique report_ids")
             print(f"Step 3: Processing in batches of {batch_size}...")
-        
+
+        # Pack report_ids into batches greedily, bounded by both batch_size and the characters the in.(...) filter adds to
+        # the URL. Servers cap URLs around 8 KB and silently truncate past that, so stay under a conservative budget.
+        batches = []
+        current_batch = []
+        current_chars = 0
+        for report_id in report_ids:
+            if current_batch and (len(current_batch) >= batch_size or current_chars + len(report_id) + 1 > self.max_filter_chars):
+                batches.append(current_batch)
+                current_batch = []
+                current_chars = 0
+            current_batch.append(report_id)
+            current_chars += len(report_id) + 1  # +1 for the joining comma.
+        if current_batch:
+            batches.append(current_batch)
+
+        writer = _ParquetSink(sink) if sink is not None else None  # Stream batches to Parquet instead of accumulating in memory.
+        # save_progress keeps rolling on-disk checkpoint segments so a killed run does not throw away hours of requests.
+        # A ParquetWriter that is never closed has no footer and cannot be read back, so one ever-open checkpoint file
+        # would be unreadable in exactly the crash it exists for; instead each segment is closed after
+        # checkpoint_interval batches, making every finished segment a valid Parquet file on its own. When a sink is
+        # given the results are already on disk, so separate checkpoints are redundant.
+        save_checkpoints = save_progress and writer is None
+        checkpoint = None
+        checkpoint_seq = 0
+        checkpoint_batches = 0
+        checkpoint_interval = 100  # Batches per checkpoint segment.
+        total_records = 0
         all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
+        total_batches = len(batches)
         failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
 
-            # Add retry logic for network issues
+        def fetch_batch(batch_ids: List[str]) -> List[Dict]:
+            """Fetch one report_id batch, retrying transient network failures with exponential backoff."""
+            # Create the filter for this batch of report_ids once; it is constant across retry attempts.
+            # PostgREST syntax: report_id=in.(id1,id2,id3,...)
+            params = {'report_id': f"in.({','.join(batch_ids)})"}
             max_retries = 3
             retry_delay = 5  # seconds
-            batch_success = False
             for attempt in range(max_retries):
                 try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='federal_awards', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} federal award records")
-                    break  # Success, exit retry loop
-
+                    return self._make_request(endpoint_name=endpoint_name, params=params, handle_429=True)
                 except APIError as e:
                     if attempt < max_retries - 1:  # Not the last attempt
                         if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
@@ -668,645 +1158,112 @@ class FACClient:
                             time.sleep(retry_delay)
                             retry_delay *= 2  # Exponential backoff
                             continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"  Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
+                    raise  # Last attempt or non-network error
 
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"  Progress checkpoint: {len(all_results)} records collected so far")
+        # Fetch batches on a thread pool. Sharing self.session is safe for GETs, and the token bucket already paces the
+        # aggregate request rate, so no per-batch sleep is needed. Results are consumed on this thread as they complete,
+        # keeping the Parquet writers single-threaded.
+        completed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(fetch_batch, batch_ids): (batch_num, batch_ids)
+                    for batch_num, batch_ids in enumerate(batches, start=1)
+                }
+                for future in as_completed(futures):
+                    batch_num, batch_ids = futures[future]
+                    completed += 1
+                    try:
+                        results = future.result()
+                    except APIError as e:
+                        if show_progress:
+                            print(f"  Error processing batch {batch_num}: {e}")
+                        failed_batches.append((batch_num, batch_ids))
+                        continue
+                    if writer is not None:
+                        writer.write_page(results)
+                    else:
+                        all_results.extend(results)
+                    total_records += len(results)
+                    if show_progress:
+                        print(f"  Batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids): found {len(results)} {record_label} records")
+
+                    if save_checkpoints:
+                        if checkpoint is None:  # Start the next checkpoint segment.
+                            checkpoint_seq += 1
+                            checkpoint = _ParquetSink(get_raw_data_path(f"{endpoint_name}_ckpt_{checkpoint_seq}.parquet"))
+                        checkpoint.write_page(results)
+                        checkpoint_batches += 1
+                        if checkpoint_batches >= checkpoint_interval:  # Rotate: finalize the footer so the segment is readable now.
+                            checkpoint.close()
+                            checkpoint = None
+                            checkpoint_batches = 0
+                            if show_progress:
+                                print(f"  Progress checkpoint: {total_records} records persisted so far")
+        finally:
+            # Close even on an unexpected exception; skipping close would drop the footer of everything already fetched.
+            if checkpoint is not None:
+                checkpoint.close()
+            if writer is not None:
+                writer.close()
 
         if show_progress:
-            print(f"\nCompleted! Total federal award records retrieved: {len(all_results)}")
+            print(f"\nCompleted! Total {record_label} records retrieved: {total_records}")
             if failed_batches:
                 print(f"Warning: {len(failed_batches)} batches failed due to network issues")
                 print("You may want to retry those specific batches")
-        
+
+        if writer is not None:
+            return writer.path
         return all_results
 
-    def get_all_additional_eins(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
+    def get_all_federal_awards(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8, sink: str | Path | None = None):
+        """
+        Purpose:
+            Retrieve all federal award records by batching report_ids from general endpoint.
+            This approach works around the federal_awards endpoint's limited filtering options.
+        Args:
+            batch_size: Number of report_ids to include in each API call (adjust to stay under 20K limit)
+            show_progress: Whether to print progress updates
+            max_workers: Number of concurrent batch fetches against the API
+            sink: Optional Parquet file path. When given, each batch is appended to the file as it arrives and the path
+                is returned instead of an in-memory list, keeping memory flat for full-corpus crawls.
+        Returns:
+            List of all federal award records, or the sink Path when sink is given
+        """
+        return self._collect_by_report_ids('federal_awards', 'federal award', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers, sink=sink)
+
+    def get_all_additional_eins(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
         """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
+        return self._collect_by_report_ids('additional_eins', 'additional ein', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='additional_eins', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} additional ein records")
-                    break  # Success, exit retry loop
+    def get_all_additional_ueis(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
+        """"""
+        return self._collect_by_report_ids('additional_ueis', 'additional uei', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"  Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"  Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
+    def get_all_corrective_action_plans(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
+        """"""
+        return self._collect_by_report_ids('corrective_action_plans', 'corrective action plan', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
+    def get_all_findings(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
+        """"""
+        return self._collect_by_report_ids('findings', 'finding', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"  Progress checkpoint: {len(all_results)} records collected so far")
+    def get_all_findings_text(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
+        """"""
+        return self._collect_by_report_ids('findings_text', 'findings text', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-        if show_progress:
-            print(f"\nCompleted! Total additional ein records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_additional_ueis(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
+    def get_all_notes_to_sefa(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
         """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='additional_ueis', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} additional uei records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"  Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"  Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"  Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total additional uei records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_corrective_action_plans(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
-        """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='corrective_action_plans', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"Found {len(results)} corrective action plan records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total corrective action plan records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_findings(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
-        """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='findings', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} finding records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total findings records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_findings_text(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
-        """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='findings_text', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"Found {len(results)} findings text records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total findings text records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_notes_to_sefa(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
-        """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='notes_to_sefa', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"Found {len(results)} note to sefa records")
-                    break  # Success, exit retry loop
+        return self._collect_by_report_ids('notes_to_sefa', 'note to sefa', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total note to sefa records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_passthrough(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
+    def get_all_passthrough(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
         """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
+        return self._collect_by_report_ids('passthrough', 'passthrough', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='passthrough', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} passthrough records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"  Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"  Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"  Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total passthrough records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
-    
-    def get_all_secondary_auditors(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False):
+    def get_all_secondary_auditors(self, batch_size: int = 250, show_progress: bool = False, save_progress: bool = False, max_workers: int = 8):
         """"""
-        if show_progress:
-            print("Step 1: Getting all report_ids from general endpoint...")
-        
-        # Get all report id values from the general records
-        try:
-            report_id_records = self.get_all_general(columns=['report_id'], show_progress=show_progress)
-            if show_progress:
-                print(f"Retrieved {len(report_id_records)} report id records")
-            report_ids = list(set([record['report_id'] for record in report_id_records if 'report_id' in record]))  # Extract unique report_ids
-        except Exception as e:
-            raise APIError(f"Failed to get general records: {e}")
-        
-        if show_progress:
-            print(f"Step 2: Found {len(report_ids)} unique report_ids")
-            print(f"Step 3: Processing in batches of {batch_size}...")
-        
-        all_results = []
-        total_batches = (len(report_ids) + batch_size - 1) // batch_size  # Ceiling division
-        failed_batches = []
-    
-        for i in range(0, len(report_ids), batch_size):
-            batch_num = i // batch_size + 1
-            batch_ids = report_ids[i:i + batch_size]
-            if show_progress:
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch_ids)} report_ids)...")
-
-            # Add retry logic for network issues
-            max_retries = 3
-            retry_delay = 5  # seconds
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # Create filter for this batch of report_ids
-                    # PostgREST syntax: report_id=in.(id1,id2,id3,...)
-                    id_filter = f"in.({','.join(batch_ids)})"
-                    params = {'report_id': id_filter}
-                    results = self._make_request(endpoint_name='secondary_auditors', params=params, handle_429=True)
-                    all_results.extend(results)
-                    batch_success = True
-                    if show_progress:
-                        print(f"  Found {len(results)} secondary auditors records")
-                    break  # Success, exit retry loop
-
-                except APIError as e:
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        if "Failed to connect" in str(e) or "Failed to resolve" in str(e) or "NameResolutionError" in str(e):
-                            if show_progress:
-                                print(f"  Network error on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        
-                    # Last attempt or non-network error
-                    if show_progress:
-                        print(f"  Error processing batch {batch_num} (attempt {attempt + 1}): {e}")
-                    break
-                
-            if not batch_success:
-                failed_batches.append((batch_num, batch_ids))
-
-            if batch_num < total_batches:  # Add small delay between batches to be nice to the API
-                time.sleep(0.5)
-
-            if save_progress and batch_num % 100 == 0:  # Save progress periodically
-                if show_progress:
-                    print(f"  Progress checkpoint: {len(all_results)} records collected so far")
-
-        if show_progress:
-            print(f"\nCompleted! Total secondary auditor records retrieved: {len(all_results)}")
-            if failed_batches:
-                print(f"Warning: {len(failed_batches)} batches failed due to network issues")
-                print("You may want to retry those specific batches")
-        
-        return all_results
+        return self._collect_by_report_ids('secondary_auditors', 'secondary auditor', batch_size=batch_size, show_progress=show_progress, save_progress=save_progress, max_workers=max_workers)
 
 
 #%%
@@ -2,44 +2,150 @@
 """Cache management utilities and configuration"""
 #%%
 #
-from datetime import datetime
-import json
+import fnmatch
+import functools
 import os
 from pathlib import Path
-import sqlite3
-from typing import Dict, List, Optional, Set, Union
+from typing import ClassVar, Dict, List, Optional, Set
+
+
+#%%
+# Conventional cache file extensions, built once at import instead of per call.
+_EXTENSION_MAP = {
+    "json": ".json"
+    , "db": ".db"
+    , "sqlite": ".db"
+    , "text": ".txt"
+    , "txt": ".txt"
+}
+
+
+#%%
+# Memoized path builders. Pipeline code resolves the same handful of cache names over and over, so after the first call
+# each combination collapses to one dict lookup returning an already-built Path (immutable, safe to share).
+@functools.lru_cache(maxsize=256)
+def _cache_path_cached(cache_dir_str: str, cache_name: str, cache_type: str) -> Path:
+    """Build (and memoize) the cache file path for one (directory, name, type) combination."""
+    if cache_type == "json":  # The default argument, by far the most common case: skip the dict probe entirely.
+        extension = ".json"
+    else:
+        extension = _EXTENSION_MAP.get(cache_type)
+        if extension is None:  # Only allocate a lowered copy when the literal spelling missed.
+            extension = _EXTENSION_MAP.get(cache_type.lower(), f".{cache_type}")
+    return Path(f"{cache_dir_str}/{cache_name}_cache{extension}")
+
+
+@functools.lru_cache(maxsize=256)
+def _data_path_cached(dir_str: str, filename: str) -> Path:
+    """Build (and memoize) the path of one file directly under dir_str."""
+    return Path(f"{dir_str}/{filename}")
 
 
 #%%
 #
 class CacheConfig:
     """Centralized cache configuration and path management"""
+
+    # Fixed attribute layout: slot storage drops the per-instance __dict__ and makes attribute reads an index lookup
+    # rather than a hash probe. cached_property needs __dict__, so the lazy directory accessors below cache manually.
+    __slots__ = (
+        "project_root"
+        , "_data_dir_str"
+        , "_logs_dir_str"
+        , "_cache_dir_str"
+        , "_processed_dir_str"
+        , "_raw_data_dir_str"
+        , "_data_dir"
+        , "_logs_dir"
+        , "_cache_dir"
+        , "_processed_dir"
+        , "_raw_data_dir"
+    )
+
+    _dirs_created: ClassVar[Set[str]] = set()  # Directories already created in-process; their mkdir syscalls are skipped.
+
     def __init__(self, project_root: str | None = None) -> None:
         # Auto-detect project root if not provided
         if project_root is None:  # Assumes this file is in src/utils/
-            current_file = Path(__file__).resolve()
-            self.project_root = current_file.parent.parent.parent
+            # abspath is pure string work; resolve() walks every component with readlink syscalls.
+            root_str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            self.project_root = Path(root_str)
         else:
             self.project_root = Path(project_root)
-        
-        # Define directory structure
-        self.data_dir = self.project_root / "data"
-        self.logs_dir = self.project_root / "logs"
-        self.cache_dir = self.data_dir / "cache"
-        self.processed_dir = self.data_dir / "processed"
-        self.raw_data_dir = self.data_dir / "raw"
-        
-        # Create directories if they don't exist
-        self._ensure_directories()
-    
-    def _ensure_directories(self) -> None:
+
+        # Define the directory layout as strings. The path getters run in tight loops (one path per report_id in
+        # pipeline code), and building results from a prefix string is cheaper than chaining Path.__truediv__ joins.
+        # No directory is created here: creation happens lazily on first use, so importing this module (which builds the
+        # global cache_config) does no filesystem I/O.
+        root_str = os.fspath(self.project_root)
+        self._data_dir_str = f"{root_str}/data"
+        self._logs_dir_str = f"{root_str}/logs"
+        self._cache_dir_str = f"{self._data_dir_str}/cache"
+        self._processed_dir_str = f"{self._data_dir_str}/processed"
+        self._raw_data_dir_str = f"{self._data_dir_str}/raw"
+
+        # Backing slots for the lazily created directory Paths below; filled on first property access.
+        self._data_dir: Optional[Path] = None
+        self._logs_dir: Optional[Path] = None
+        self._cache_dir: Optional[Path] = None
+        self._processed_dir: Optional[Path] = None
+        self._raw_data_dir: Optional[Path] = None
+
+    def _ensure_dir(self, dir_str: str) -> None:
         """
         Purpose:
-            Create necessary directories if they don't exist
+            Create a directory on first use. Directories already created by this process are remembered class-wide, so
+            the hot path is a single set lookup with zero filesystem syscalls.
+        Args:
+            dir_str: Directory path string to create if needed.
         """
-        for directory in [self.data_dir, self.cache_dir, self.raw_data_dir, self.processed_dir, self.logs_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
-    
+        if dir_str not in CacheConfig._dirs_created:
+            # os.makedirs takes the string directly; Path(...).mkdir builds a Path object just to throw it away.
+            # Its recursive creation also covers data/ implicitly whenever a child like data/cache is made first.
+            os.makedirs(dir_str, exist_ok=True)
+            CacheConfig._dirs_created.add(dir_str)
+
+    @property
+    def data_dir(self) -> Path:
+        """Data directory, created on first access."""
+        if self._data_dir is None:
+            self._ensure_dir(self._data_dir_str)
+            self._data_dir = Path(self._data_dir_str)
+        return self._data_dir
+
+    @property
+    def logs_dir(self) -> Path:
+        """Logs directory, created on first access."""
+        if self._logs_dir is None:
+            self._ensure_dir(self._logs_dir_str)
+            self._logs_dir = Path(self._logs_dir_str)
+        return self._logs_dir
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache directory, created on first access."""
+        if self._cache_dir is None:
+            self._ensure_dir(self._cache_dir_str)
+            self._cache_dir = Path(self._cache_dir_str)
+        return self._cache_dir
+
+    @property
+    def processed_dir(self) -> Path:
+        """Processed data directory, created on first access."""
+        if self._processed_dir is None:
+            self._ensure_dir(self._processed_dir_str)
+            self._processed_dir = Path(self._processed_dir_str)
+        return self._processed_dir
+
+    @property
+    def raw_data_dir(self) -> Path:
+        """Raw data directory, created on first access."""
+        if self._raw_data_dir is None:
+            self._ensure_dir(self._raw_data_dir_str)
+            self._raw_data_dir = Path(self._raw_data_dir_str)
+        return self._raw_data_dir
+
+
     def get_cache_path(self, cache_name: str, cache_type: str = "json") -> Path:
         """
         Purpose:
@@ -50,17 +156,27 @@ class CacheConfig:
         Returns:
             Path object for the cache file
         """
-        extension_map = {  # Rename conventional extensions for clarity.
-            "json": ".json"
-            , "db": ".db"
-            , "sqlite": ".db"
-            , "text": ".txt"
-            , "txt": ".txt"
-        }
-        extension = extension_map.get(cache_type.lower(), f".{cache_type}")
-        filename = f"{cache_name}_cache{extension}"
-        return self.cache_dir / filename
-    
+        self._ensure_dir(self._cache_dir_str)  # Callers write to the returned path; a set lookup once the directory exists.
+        return _cache_path_cached(self._cache_dir_str, cache_name, cache_type)
+
+    def get_cache_paths_batch(self, cache_names: List[str], cache_type: str = "json") -> Dict[str, Path]:
+        """
+        Purpose:
+            Get standardized cache file paths for many cache names at once. The extension and directory are resolved a
+            single time, so the per-name cost is one f-string and one Path construction.
+        Args:
+            cache_names: Names of the caches (e.g., ['fac_report_ids', 'census_data'])
+            cache_type: Type of cache file ('json', 'db', 'txt'), shared by every name
+        Returns:
+            Dictionary mapping each cache name to its Path object
+        """
+        self._ensure_dir(self._cache_dir_str)
+        extension = _EXTENSION_MAP.get(cache_type)
+        if extension is None:
+            extension = _EXTENSION_MAP.get(cache_type.lower(), f".{cache_type}")
+        prefix = self._cache_dir_str
+        return {name: Path(f"{prefix}/{name}_cache{extension}") for name in cache_names}
+
     def get_processed_data_path(self, filename: str) -> Path:
         """
         Purpose:
@@ -68,7 +184,8 @@ class CacheConfig:
         Returns:
             Path object for the processed data file
         """
-        return self.processed_dir / filename
+        self._ensure_dir(self._processed_dir_str)
+        return _data_path_cached(self._processed_dir_str, filename)
     
     def get_raw_data_path(self, filename: str) -> Path:
         """
@@ -77,7 +194,8 @@ class CacheConfig:
         Returns:
             Path object for the raw data file
         """
-        return self.raw_data_dir / filename
+        self._ensure_dir(self._raw_data_dir_str)
+        return _data_path_cached(self._raw_data_dir_str, filename)
     
     def get_log_path(self, log_name: str) -> Path:
         """
@@ -86,7 +204,8 @@ class CacheConfig:
         Returns:
             Path object for the log file
         """
-        return self.logs_dir / f"{log_name}.log"
+        self._ensure_dir(self._logs_dir_str)
+        return _data_path_cached(self._logs_dir_str, f"{log_name}.log")
     
     def list_cache_files(self) -> list:
         """
@@ -95,65 +214,93 @@ class CacheConfig:
         Returns:
             List of cache file names
         """
-        if not self.cache_dir.exists():
+        try:
+            # Scan the raw directory string: the cache_dir property would create the directory as a side effect, which
+            # a pure reader should not do (and would make this FileNotFoundError unreachable).
+            entries = os.scandir(self._cache_dir_str)
+        except FileNotFoundError:  # Cheaper than a separate exists() stat on the common path where the directory is there.
             return []
-        return [f.name for f in self.cache_dir.iterdir() if f.is_file()]
+        with entries:
+            return [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
     
     def get_cache_info(self) -> dict:
         """
         Purpose:
             Get information about all cache files
         Returns:
-            Dictionary with cache file names as keys and their size and modification time as values
+            Dictionary with cache file names as keys and their size in bytes and modification time as values.
+            Display code can format with size_bytes / (1 << 20) for MB.
         """
         cache_info = {}
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.iterdir():
-                if cache_file.is_file():
-                    stat = cache_file.stat()
-                    cache_info[cache_file.name] = {
-                        "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                        "modified": stat.st_mtime,
-                        "path": str(cache_file)
-                    }
-        
+        try:
+            scan = os.scandir(self._cache_dir_str)
+        except FileNotFoundError:  # Cheaper than a separate exists() stat on the common path where the directory is there.
+            return cache_info
+        with scan:
+            for entry in scan:
+                if not entry.is_file(follow_symlinks=False):  # Answered from the directory scan itself; no extra syscall.
+                    continue
+                stat = entry.stat()  # DirEntry caches the stat result from the scan where the platform allows.
+                cache_info[entry.name] = {
+                    "size_bytes": stat.st_size,  # Raw bytes: full precision, no float math in the scan loop.
+                    "modified": stat.st_mtime,
+                    "path": entry.path
+                }
+
         return cache_info
     
-    def clear_cache(self, cache_pattern: Optional[str] = None):
+    def clear_cache(self, cache_pattern: Optional[str] = None, *, confirm: bool = False, verbose: bool = False):
         """
-        Clear cache files
-        
+        Purpose:
+            Clear cache files without blocking on terminal input, so batch jobs can call this safely.
         Args:
-            cache_pattern: Pattern to match (e.g., 'fac_*'). If None, prompts for confirmation.
+            cache_pattern: Pattern to match (e.g., 'fac_*'). If None, the whole cache directory is wiped, which
+                requires confirm=True.
+            confirm: Required acknowledgement when cache_pattern is None.
+            verbose: Print the files being deleted and a summary. Failures are always reported.
         """
-        import glob
-        
+        if cache_pattern is None and not confirm:
+            raise ValueError("Pass confirm=True to wipe entire cache")
+
+        # One directory scan serves both branches; the old glob.glob call re-enumerated the directory with extra lstats.
+        try:
+            scan = os.scandir(self._cache_dir_str)
+        except FileNotFoundError:
+            if verbose:
+                print("No cache files found to delete.")
+            return
+        with scan:
+            entries = [(entry.name, entry.path) for entry in scan if entry.is_file(follow_symlinks=False)]
+
         if cache_pattern:
-            pattern_path = self.cache_dir / cache_pattern
-            files_to_delete = glob.glob(str(pattern_path))
+            matched = set(fnmatch.filter([name for name, _ in entries], cache_pattern))  # C-implemented pattern match.
+            files_to_delete = [path for name, path in entries if name in matched]
         else:
-            files_to_delete = [str(f) for f in self.cache_dir.iterdir() if f.is_file()]
-        
+            files_to_delete = [path for _, path in entries]
+
         if not files_to_delete:
-            print("No cache files found to delete.")
+            if verbose:
+                print("No cache files found to delete.")
             return
-        
-        print(f"Found {len(files_to_delete)} cache files:")
-        for file_path in files_to_delete:
-            print(f"  - {Path(file_path).name}")
-        
-        if cache_pattern is None:
-            confirm = input("Delete all these files? (y/N): ")
-            if confirm.lower() != 'y':
-                print("Cache clearing cancelled.")
-                return
-        
+
+        # Accumulate results and print once after the loop; a print per file flushes stdout per deletion.
+        deleted = []
+        failed = []
         for file_path in files_to_delete:
             try:
-                os.remove(file_path)
-                print(f"Deleted: {Path(file_path).name}")
+                os.unlink(file_path)  # Delete using the path captured during the scan; no re-stat.
+                deleted.append(os.path.basename(file_path))
             except Exception as e:
-                print(f"Error deleting {Path(file_path).name}: {e}")
+                failed.append((os.path.basename(file_path), e))
+
+        if verbose:
+            print(f"Deleted {len(deleted)} cache files:")
+            for file_name in deleted:
+                print(f"  - {file_name}")
+        if failed:
+            print(f"Failed to delete {len(failed)} cache files:")
+            for file_name, error in failed:
+                print(f"  - {file_name}: {error}")
 
 
 #%%